@@ -1,12 +1,12 @@
 from functools import wraps
 
-from django.utils.decorators import available_attrs, method_decorator
+from django.utils.decorators import available_attrs
 from django.views.decorators.cache import never_cache
 from django.views.decorators.http import last_modified as cache_last_modified
 from django.utils.translation import ugettext_lazy as _
 from django.core.exceptions import PermissionDenied
 from django.core.cache import caches
-from django.contrib.auth.decorators import user_passes_test
+from django.contrib.auth.views import redirect_to_login
 from django.contrib import messages
 from django.views.generic.edit import BaseUpdateView
 from django.views.generic.detail import BaseDetailView
@@ -37,6 +37,8 @@ def view_permission_required(login_url=None, raise_exception=None):
     def decorator(view_func):
         def _wrapped_view(self, request, *args, **kwargs):
             perm = self.get_view_perm()
+            if check_perms(request, request.user, perm):
+                return view_func(self, request, *args, **kwargs)
 
             redirect_url = login_url
             if login_url in mapentity_models.ENTITY_KINDS:
@@ -48,37 +50,36 @@ def view_permission_required(login_url=None, raise_exception=None):
                 get_url_method = getattr(view_subject, 'get_{0}_url'.format(login_url))
                 redirect_url = get_url_method()
 
-            has_perm_decorator = user_passes_test(lambda u: check_perms(request, u, perm),
-                                                  login_url=redirect_url,
-                                                  redirect_field_name=None)
-            cbv_user_has_perm = method_decorator(has_perm_decorator)
-
-            @cbv_user_has_perm
-            def decorated(self, request, *args, **kwargs):
-                return view_func(self, request, *args, **kwargs)
-
-            return decorated(self, request, *args, **kwargs)
+            return redirect_to_login(request.get_full_path(), redirect_url,
+                                     redirect_field_name=None)
 
         return _wrapped_view
     return decorator
 
 
-def view_cache_latest():
-    def decorator(view_func):
-        def _wrapped_view(self, request, *args, **kwargs):
-            view_model = self.get_model()
+def view_latest_updated(view):
+    """
+    Return the latest update of the view model, queried once per view
+    instance (i.e. once per request).
+    """
+    if not hasattr(view, '_latest_updated'):
+        view._latest_updated = view.get_model().latest_updated()
+    return view._latest_updated
 
-            cache_latest = cache_last_modified(lambda x: view_model.latest_updated())
-            cbv_cache_latest = method_decorator(cache_latest)
 
-            # The first decorator forces browser's cache revalidation.
-            # The second one allows browser's cache revalidation.
-            @method_decorator(never_cache)
-            @cbv_cache_latest
-            def decorated(self, request, *args, **kwargs):
-                return view_func(self, request, *args, **kwargs)
+def view_cache_latest():
+    def decorator(view_func):
+        # The view instance is passed after the request, so that the
+        # decorators below are applied once, instead of on each call.
+        # The first decorator forces browser's cache revalidation.
+        # The second one allows browser's cache revalidation.
+        @never_cache
+        @cache_last_modified(lambda request, view, *args, **kwargs: view_latest_updated(view))
+        def decorated(request, view, *args, **kwargs):
+            return view_func(view, request, *args, **kwargs)
 
-            return decorated(self, request, *args, **kwargs)
+        def _wrapped_view(self, request, *args, **kwargs):
+            return decorated(request, self, *args, **kwargs)
 
         return _wrapped_view
     return decorator
@@ -92,36 +93,48 @@ def view_cache_response_content():
 
             # Do not (re)store cache if filters presents
             params = self.request.GET.keys()
-            with_filters = all([not p.startswith('_') for p in params])
+            with_filters = all(not p.startswith('_') for p in params)
             if len(params) > 0 and with_filters:
                 return view_func(self, *args, **kwargs)
 
             # Otherwise, restore from cache or store view result
+            geojson_version = None
             if hasattr(self, 'view_cache_key'):
                 geojson_lookup = self.view_cache_key()
             else:
                 view_model = self.get_model()
                 language = self.request.LANGUAGE_CODE
-                latest_saved = view_model.latest_updated()
+                latest_saved = view_latest_updated(self)
                 if latest_saved:
-                    geojson_lookup = '%s_%s_%s_json_layer' % (
+                    geojson_lookup = '%s_%s_json_layer' % (
                         language,
-                        view_model._meta.model_name,
-                        latest_saved.strftime('%y%m%d%H%M%S%f')
+                        view_model._meta.model_name
                     )
+                    geojson_version = latest_saved.strftime('%y%m%d%H%M%S%f')
                 else:
                     geojson_lookup = None
 
             geojson_cache = caches[app_settings['GEOJSON_LAYERS_CACHE_BACKEND']]
 
-            if geojson_lookup:
+            if geojson_lookup and geojson_version is None:
                 content = geojson_cache.get(geojson_lookup)
                 if content:
                     return response_class(content=content, **response_kwargs)
+            elif geojson_lookup:
+                # Check the small version entry before fetching the (large) content
+                if geojson_cache.get(geojson_lookup + '_version') == geojson_version:
+                    cached = geojson_cache.get(geojson_lookup)
+                    if cached and cached[0] == geojson_version:
+                        return response_class(content=cached[1], **response_kwargs)
 
             response = view_func(self, *args, **kwargs)
-            if geojson_lookup:
+            if geojson_lookup and geojson_version is None:
                 geojson_cache.set(geojson_lookup, response.content)
+            elif geojson_lookup:
+                geojson_cache.set_many({
+                    geojson_lookup: (geojson_version, response.content),
+                    geojson_lookup + '_version': geojson_version,
+                })
             return response
 
         return _wrapped_method
@@ -140,15 +153,16 @@ def save_history():
 
             # Stack list of request paths
             history = request.session.get('history', [])
-            # Remove previous visits of this page
-            history = [h for h in history if h['path'] != request.path]
+            # Remove previous visit of this page (paths are unique in history)
+            index = next((i for i, h in enumerate(history) if h['path'] == request.path), None)
+            if index is not None:
+                del history[index]
             # Add this one and remove extras
             model = self.model or self.queryset.model
             history.insert(0, dict(title=self.get_title(),
                                    path=request.path,
-                                   modelname=model._meta.object_name.lower()))
-            if len(history) > app_settings['HISTORY_ITEMS_MAX']:
-                history.pop()
+                                   modelname=model._meta.model_name))
+            del history[app_settings['HISTORY_ITEMS_MAX']:]
             request.session['history'] = history
 
             return result
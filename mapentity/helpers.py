@@ -326,14 +326,27 @@ def name_for(app, modelname, suffix):
     return "%s/%s%s" % (app, modelname, suffix)
 
 
+# Resolved template names, by model and suffix (see smart_get_template())
+_smart_templates = {}
+# Templates tried after the model specific one
+_fallback_templates = (("mapentity", "override"),
+                       ("mapentity", "mapentity"))
+
+
 def smart_get_template(model, suffix):
-    for appname, modelname in [(model._meta.app_label, model._meta.object_name.lower()),
-                               ("mapentity", "override"),
-                               ("mapentity", "mapentity")]:
+    key = (model, suffix)
+    if key in _smart_templates and not settings.DEBUG:
+        return _smart_templates[key]
+
+    found = None
+    for appname, modelname in ((model._meta.app_label, model._meta.model_name),) + _fallback_templates:
         try:
             template_name = name_for(appname, modelname, suffix)
             get_template(template_name)  # Will raise if not exist
-            return template_name
+            found = template_name
+            break
         except TemplateDoesNotExist:
             pass
-    return None
+    if found is not None:  # Missing templates may be added later
+        _smart_templates[key] = found
+    return found
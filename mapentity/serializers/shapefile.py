@@ -47,7 +47,7 @@ class ZipShapeSerializer(Serializer):
         filename = options.pop('filename', 'shp_download')
         # Zip all shapefiles created temporarily
         self._create_shape(queryset, model, columns, filename)
-        self.zip_shapefiles(stream, delete=delete)
+        return self.zip_shapefiles(stream, delete=delete)
 
     def zip_shapefiles(self, stream, delete=True):
         # Can't use stream, because HttpResponse is not seekable
@@ -64,8 +64,10 @@ class ZipShapeSerializer(Serializer):
 
         zipf.close()
         buffr.flush()  # zip.close() writes stuff.
+        size = buffr.tell()
         stream.write(buffr.getvalue())
         buffr.close()
+        return size
 
     def _create_shape(self, queryset, model, columns, filename):
         """Split a shapes into one or more shapes (one for point and one for linestring)
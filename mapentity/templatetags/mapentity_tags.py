@@ -147,7 +147,7 @@ def valuelist(items, field=None, enumeration=False):
     if len(items) > 0:
         oneitem = items[0]
         if hasattr(oneitem, '_meta'):
-            modelname = oneitem._meta.object_name.lower()
+            modelname = oneitem._meta.model_name
 
     return {
         'valuelist': valuelist,
@@ -180,11 +180,10 @@ def valuetable(items, columns='', enumeration=False):
 
     if len(items) > 0:
         oneitem = items[0]
-        columns_titles = []
-        for column in columns:
-            columns_titles.append({'name': column,
-                                   'text': field_verbose_name(oneitem, column)})
-        modelname = oneitem._meta.object_name.lower()
+        columns_titles = [{'name': column,
+                           'text': field_verbose_name(oneitem, column)}
+                          for column in columns]
+        modelname = oneitem._meta.model_name
     else:
         modelname = None
         columns_titles = None
@@ -1,3 +1,5 @@
+import re
+
 from django.conf import settings
 from django.conf.urls import url, include
 
@@ -9,11 +11,7 @@ if app_settings['ACTION_HISTORY_ENABLED']:
     from .models import LogEntry
 
 
-_MEDIA_URL = settings.MEDIA_URL.replace(app_settings['ROOT_URL'], '')
-if _MEDIA_URL.startswith('/'):
-    _MEDIA_URL = _MEDIA_URL[1:]
-if _MEDIA_URL.endswith('/'):
-    _MEDIA_URL = _MEDIA_URL[:-1]
+_MEDIA_URL = re.escape(settings.MEDIA_URL.replace(app_settings['ROOT_URL'], '').strip('/'))
 
 
 urlpatterns = [
@@ -29,7 +27,7 @@ urlpatterns = [
 
 if settings.DEBUG or app_settings['SENDFILE_HTTP_HEADER']:
     urlpatterns += [
-        url(r'^%s/(?P<path>paperclip/(?P<app_label>.+)_(?P<model_name>.+)/(?P<pk>\d+)/.+)$' % _MEDIA_URL,
+        url(r'^%s/(?P<path>paperclip/(?P<app_label>[^/]+)_(?P<model_name>[^/]+)/(?P<pk>\d+)/.+)$' % _MEDIA_URL,
             serve_attachment),
     ]
 
@@ -32,7 +32,7 @@ class MapEntityLayer(FilterListMixin, ModelViewMixin, GeoJSONLayerView):
         # Backward compatibility with django-geojson 1.X
         # for JS ObjectsLayer and rando-trekking application
         # TODO: remove when migrated
-        properties = dict([(k, k) for k in self.properties])
+        properties = {k: k for k in self.properties}
         if 'id' not in self.properties:
             properties['id'] = 'pk'
         self.properties = properties
@@ -217,6 +217,8 @@ def history_delete(request, path=None):
     if path:
         history = request.session.get('history')
         if history:
-            history = [h for h in history if h['path'] != path]
-            request.session['history'] = history
+            index = next((i for i, h in enumerate(history) if h['path'] == path), None)
+            if index is not None:
+                del history[index]
+                request.session['history'] = history
     return HttpResponse()
@@ -8,6 +8,7 @@ from django.http import HttpResponse, HttpResponseBadRequest
 from django.utils.translation import ugettext_lazy as _
 from django.utils.decorators import method_decorator
 from django.utils.encoding import force_text
+from django.utils.six.moves.urllib.parse import urljoin
 from django.views import static
 from django.views.generic.detail import DetailView
 from django.views.generic import View
@@ -75,6 +76,8 @@ class MapEntityList(BaseListView, ListView):
 
     def get_context_data(self, **kwargs):
         context = super(MapEntityList, self).get_context_data(**kwargs)
+        if self._filterform is None:  # Not filtered yet by get_queryset()
+            self._filterform = self.filterform(None, self.queryset)
         context['filterform'] = self._filterform  # From FilterListMixin
         context['columns'] = self.columns  # From BaseListView
 
@@ -137,9 +140,9 @@ class MapEntityFormat(BaseListView, ListView):
     def shape_view(self, request, context, **kwargs):
         serializer = mapentity_serializers.ZipShapeSerializer()
         response = HttpResponse(content_type='application/zip')
-        serializer.serialize(queryset=self.get_queryset(), model=self.get_model(),
-                             stream=response, fields=self.columns)
-        response['Content-length'] = str(len(response.content))
+        size = serializer.serialize(queryset=self.get_queryset(), model=self.get_model(),
+                                    stream=response, fields=self.columns)
+        response['Content-length'] = str(size)
         return response
 
     def gpx_view(self, request, context, **kwargs):
@@ -198,8 +201,8 @@ class MapEntityDocumentBase(ModelViewMixin, DetailView):
         context = super(MapEntityDocumentBase, self).get_context_data(**kwargs)
         context['datetime'] = datetime.now()
         context['objecticon'] = os.path.join(settings.STATIC_ROOT, self.get_entity().icon_big)
-        context['STATIC_URL'] = self.request.build_absolute_uri(settings.STATIC_URL)[:-1]
-        context['MEDIA_URL'] = self.request.build_absolute_uri(settings.MEDIA_URL)[:-1]
+        context['STATIC_URL'] = urljoin(rooturl, settings.STATIC_URL)[:-1]
+        context['MEDIA_URL'] = urljoin(rooturl, settings.MEDIA_URL)[:-1]
         context['MEDIA_ROOT'] = settings.MEDIA_ROOT + '/'
         return context
 
@@ -213,7 +216,7 @@ class MapEntityDocumentWeasyprint(MapEntityDocumentBase, PDFTemplateResponseMixi
         self.template_name = smart_get_template(self.model, suffix)
         if not self.template_name:
             raise TemplateDoesNotExist(name_for(self.model._meta.app_label,
-                                                self.model._meta.object_name.lower(), suffix))
+                                                self.model._meta.model_name, suffix))
         self.template_attributes = smart_get_template(self.model, suffix_for(self.template_name_suffix,
                                                                              "_attributes", "html"))
         self.template_css = smart_get_template(self.model, suffix_for(self.template_name_suffix, "_pdf", "css"))
@@ -237,7 +240,7 @@ class MapEntityDocumentOdt(MapEntityDocumentBase):
         self.template_name = smart_get_template(self.model, suffix)
         if not self.template_name:
             raise TemplateDoesNotExist(name_for(self.model._meta.app_label,
-                                                self.model._meta.object_name.lower(), suffix))
+                                                self.model._meta.model_name, suffix))
 
     def get_context_data(self, **kwargs):
         context = super(MapEntityDocumentOdt, self).get_context_data(**kwargs)
@@ -384,14 +387,15 @@ class MapEntityDetail(ModelViewMixin, DetailView):
     def get_context_data(self, **kwargs):
         context = super(MapEntityDetail, self).get_context_data(**kwargs)
         logentries_max = app_settings['ACTION_HISTORY_LENGTH']
-        logentries = LogEntry.objects.filter(
+        # Fetch one extra entry to know if there are more, without counting
+        logentries = list(LogEntry.objects.filter(
             content_type_id=self.object.get_content_type_id(),
             object_id=self.object.pk
-        ).order_by('-id')
+        ).order_by('-id')[:logentries_max + 1])
         context['activetab'] = self.request.GET.get('tab')
         context['empty_map_message'] = _("No map available for this object.")
         context['logentries'] = logentries[:logentries_max]
-        context['logentries_hellip'] = logentries.count() > logentries_max
+        context['logentries_hellip'] = len(logentries) > logentries_max
 
         perm_update = self.get_model().get_permission_codename(mapentity_models.ENTITY_UPDATE)
         can_edit = user_has_perm(self.request.user, perm_update)
@@ -88,7 +88,7 @@ class ModelViewMixin(object):
         if model:
             context['model'] = model
             context['appname'] = model._meta.app_label.lower()
-            context['modelname'] = model._meta.object_name.lower()
+            context['modelname'] = model._meta.model_name
             context['objectname'] = model._meta.verbose_name
             context['objectsname'] = model._meta.verbose_name_plural
         return context
@@ -114,21 +114,27 @@ class FormViewMixin(object):
 class FilterListMixin(object):
 
     filterform = None
+    _filterform = None
 
     def __init__(self):
+        if self.filterform is None:
+            self.filterform = self.get_default_filterform()
 
-        _model = self.model
-        if _model is None:
-            _model = self.queryset.model
+    @classmethod
+    def get_default_filterform(cls):
+        # Built once per view class, since it introspects model fields
+        if '_default_filterform' not in cls.__dict__:
+            _model = cls.model
+            if _model is None:
+                _model = cls.queryset.model
 
-        if self.filterform is None:
             class filterklass(MapEntityFilterSet):
                 class Meta:
                     model = _model
                     fields = [field.name for field in _model._meta.get_fields() if
                               not isinstance(field, GeometryField) and not isinstance(field, GenericRelation)]
-            self.filterform = filterklass
-        self._filterform = self.filterform(None, self.queryset)
+            cls._default_filterform = filterklass
+        return cls._default_filterform
 
     def get_queryset(self):
         queryset = super(FilterListMixin, self).get_queryset()
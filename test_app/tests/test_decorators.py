@@ -1,12 +1,17 @@
+from datetime import datetime
+
 import mock
-from django.http import HttpRequest
-from django.test import TransactionTestCase
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory, TransactionTestCase
 from django.conf import settings
+from django.contrib.sessions.backends.base import SessionBase
+from django.core.cache import caches
 from django.core.exceptions import PermissionDenied
 from django.core.urlresolvers import reverse
 
 from mapentity import app_settings
-from mapentity.decorators import view_permission_required
+from mapentity.decorators import save_history, view_cache_response_content, view_permission_required
+from mapentity.views import history_delete
 
 
 class ViewPermissionRequiredTestCase(TransactionTestCase):
@@ -76,3 +81,132 @@ class ViewPermissionRequiredTestCase(TransactionTestCase):
         self.assertEqual(response.status_code, 302)
         dummylist_url = reverse('test_app:dummymodel_list')
         self.assertTrue(dummylist_url in response['Location'])
+
+
+class SaveHistoryTestCase(TransactionTestCase):
+    def setUp(self):
+        self.request = mock.MagicMock(spec=HttpRequest())
+        self.request.session = {}
+        self.view = mock.MagicMock()
+        self.view.model._meta.model_name = 'dummymodel'
+        self.view.get_title.return_value = 'Title'
+        self.decorated_view = save_history()(lambda view, request: 'response')
+
+    def visit(self, path):
+        self.request.path = path
+        return self.decorated_view(self.view, self.request)
+
+    def paths(self):
+        return [h['path'] for h in self.request.session['history']]
+
+    def test_last_visit_is_first(self):
+        self.visit('/a/')
+        self.visit('/b/')
+        self.assertEqual(self.paths(), ['/b/', '/a/'])
+        self.assertEqual(self.request.session['history'][0]['modelname'], 'dummymodel')
+
+    def test_previous_visit_is_moved_on_top(self):
+        self.visit('/a/')
+        self.visit('/b/')
+        self.visit('/a/')
+        self.assertEqual(self.paths(), ['/a/', '/b/'])
+
+    def test_history_is_truncated(self):
+        for i in range(app_settings['HISTORY_ITEMS_MAX'] + 2):
+            self.visit('/%s/' % i)
+        self.assertEqual(len(self.paths()), app_settings['HISTORY_ITEMS_MAX'])
+        self.assertEqual(self.paths()[0], '/%s/' % (app_settings['HISTORY_ITEMS_MAX'] + 1))
+
+
+class HistoryDeleteTestCase(TransactionTestCase):
+    def setUp(self):
+        self.session = SessionBase()
+        self.session['history'] = [{'path': '/a/'}, {'path': '/b/'}]
+        self.session.modified = False
+
+    def delete(self, path):
+        request = RequestFactory().post('/history/delete/', {'path': path})
+        request.user = mock.MagicMock()
+        request.user.is_authenticated.return_value = True
+        request.session = self.session
+        return history_delete(request)
+
+    def test_existing_path_is_removed(self):
+        response = self.delete('/a/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.session['history'], [{'path': '/b/'}])
+        self.assertTrue(self.session.modified)
+
+    def test_unknown_path_leaves_session_unmodified(self):
+        response = self.delete('/c/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.session['history'], [{'path': '/a/'}, {'path': '/b/'}])
+        self.assertFalse(self.session.modified)
+
+
+class FakeLayerView(object):
+    response_class = HttpResponse
+
+    def __init__(self, model):
+        self.model = model
+        self.request = mock.MagicMock(GET={}, LANGUAGE_CODE='en')
+
+    def get_model(self):
+        return self.model
+
+
+class ViewCacheResponseContentTestCase(TransactionTestCase):
+    def setUp(self):
+        self.cache = caches[app_settings['GEOJSON_LAYERS_CACHE_BACKEND']]
+        self.cache.clear()
+        self.model = mock.MagicMock()
+        self.model._meta.model_name = 'fakemodel'
+        self.model.latest_updated.return_value = datetime(2017, 1, 1)
+        self.render = mock.MagicMock(side_effect=lambda view, context: HttpResponse(
+            'rendered %s' % self.render.call_count))
+        self.decorated = view_cache_response_content()(self.render)
+
+    def call(self):
+        return self.decorated(FakeLayerView(self.model), {})
+
+    def test_second_call_uses_cache(self):
+        self.call()
+        response = self.call()
+        self.assertEqual(self.render.call_count, 1)
+        self.assertEqual(response.content, b'rendered 1')
+
+    def test_newer_version_renders_again(self):
+        self.call()
+        self.model.latest_updated.return_value = datetime(2017, 1, 2)
+        response = self.call()
+        self.assertEqual(self.render.call_count, 2)
+        self.assertEqual(response.content, b'rendered 2')
+
+    def test_newer_version_replaces_stale_content(self):
+        self.call()
+        self.model.latest_updated.return_value = datetime(2017, 1, 2)
+        self.call()
+        version, content = self.cache.get('en_fakemodel_json_layer')
+        self.assertEqual(version, datetime(2017, 1, 2).strftime('%y%m%d%H%M%S%f'))
+        self.assertEqual(content, b'rendered 2')
+
+    def test_version_mismatch_does_not_read_content(self):
+        cache = mock.MagicMock()
+        cache.get.return_value = 'outdated'
+        with mock.patch('mapentity.decorators.caches',
+                        {app_settings['GEOJSON_LAYERS_CACHE_BACKEND']: cache}):
+            response = self.call()
+        cache.get.assert_called_once_with('en_fakemodel_json_layer_version')
+        self.assertEqual(self.render.call_count, 1)
+        version = datetime(2017, 1, 1).strftime('%y%m%d%H%M%S%f')
+        cache.set_many.assert_called_once_with({
+            'en_fakemodel_json_layer': (version, response.content),
+            'en_fakemodel_json_layer_version': version,
+        })
+
+    def test_missing_content_renders_again(self):
+        self.call()
+        self.cache.delete('en_fakemodel_json_layer')
+        response = self.call()
+        self.assertEqual(self.render.call_count, 2)
+        self.assertEqual(response.content, b'rendered 2')
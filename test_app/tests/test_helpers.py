@@ -1,14 +1,18 @@
 import os
 
 import mock
+from django.template.base import TemplateDoesNotExist
 from django.test import TransactionTestCase
+from django.test.utils import override_settings
 
 from mapentity import app_settings
+from mapentity import helpers as mapentity_helpers
 from mapentity.helpers import (
     capture_url,
     convertit_url,
     user_has_perm,
-    download_to_stream
+    download_to_stream,
+    smart_get_template
 )
 
 
@@ -90,3 +94,33 @@ class DownloadStreamTest(TransactionTestCase):
         # Required to specified language for example
         download_to_stream('http://google.com', open(os.devnull), silent=True, headers={'Accept-language': 'fr'})
         get_mocked.assert_called_with('http://google.com', headers={'Accept-language': 'fr'})
+
+
+class SmartGetTemplateTest(TransactionTestCase):
+    def setUp(self):
+        mapentity_helpers._smart_templates.clear()
+        self.model = mock.MagicMock()
+        self.model._meta.app_label = 'test_app'
+        self.model._meta.model_name = 'dummymodel'
+
+    def tearDown(self):
+        mapentity_helpers._smart_templates.clear()
+
+    @mock.patch('mapentity.helpers.get_template')
+    def test_template_is_resolved_once(self, get_template_mocked):
+        self.assertEqual(smart_get_template(self.model, '_detail.html'), 'test_app/dummymodel_detail.html')
+        self.assertEqual(smart_get_template(self.model, '_detail.html'), 'test_app/dummymodel_detail.html')
+        self.assertEqual(get_template_mocked.call_count, 1)
+
+    @override_settings(DEBUG=True)
+    @mock.patch('mapentity.helpers.get_template')
+    def test_template_is_resolved_each_time_in_debug(self, get_template_mocked):
+        smart_get_template(self.model, '_detail.html')
+        smart_get_template(self.model, '_detail.html')
+        self.assertEqual(get_template_mocked.call_count, 2)
+
+    @mock.patch('mapentity.helpers.get_template', side_effect=TemplateDoesNotExist('missing'))
+    def test_missing_template_is_resolved_again(self, get_template_mocked):
+        self.assertIsNone(smart_get_template(self.model, '_detail.html'))
+        get_template_mocked.side_effect = None
+        self.assertEqual(smart_get_template(self.model, '_detail.html'), 'test_app/dummymodel_detail.html')
@@ -128,9 +128,12 @@ STATIC_ROOT = os.path.join(BASE_DIR, 'static')
 
 CACHES = {
     'default': {
-        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
-        'LOCATION': 'my_cache_table',
-    }
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'geojson': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'geojson',
+    },
 }
 
 MEDIA_URL = '/media/'
@@ -143,6 +146,7 @@ TEST = True
 
 MAPENTITY_CONFIG = {
     'SENDFILE_HTTP_HEADER': 'X-Accel-Redirect',
+    'GEOJSON_LAYERS_CACHE_BACKEND': 'geojson',
 }
 
 PAPERCLIP_FILETYPE_MODEL = 'test_app.FileType'